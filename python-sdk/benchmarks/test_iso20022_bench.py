@@ -0,0 +1,60 @@
+"""Benchmarks for ISO 20022 bridge hot paths.
+
+Kept outside the default test paths; run with `pytest benchmarks/`.
+"""
+
+import pytest
+
+from erc8040_sdk import (
+    ESGClassification,
+    ESGScore,
+    FinancialInstrument,
+    ISO20022Bridge,
+    iso20022,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def bridge():
+    """Shared ISO 20022 bridge; it holds no per-call state."""
+    return ISO20022Bridge()
+
+
+def test_bench_esg_to_iso(benchmark):
+    """Benchmark the uncached conversion of an ESG score to an ISO classification."""
+    score = ESGScore.create(75.0, 70.0, 68.0)
+
+    classification = benchmark(iso20022._compute_esg_to_iso, score)
+
+    assert classification.erc8040_rating == "BBB"
+
+
+def test_bench_esg_to_iso_cached(benchmark, bridge):
+    """Benchmark esg_to_iso on a repeat score, served from the result cache."""
+    score = ESGScore.create(75.0, 70.0, 68.0)
+    bridge.esg_to_iso(score)
+
+    classification = benchmark(bridge.esg_to_iso, score)
+
+    assert classification.erc8040_rating == "BBB"
+
+
+def test_bench_create_setr_message(benchmark, bridge):
+    """Benchmark rendering a SETR message."""
+    instrument = FinancialInstrument(
+        isin="US46434G1031",
+        lei="549300PZDW6EBUUJ8G35",
+        name="ERC8040 Green Bond"
+    )
+    classification = ESGClassification(
+        taxonomy_alignment=92.0,
+        sfdr_article=9,
+        erc8040_rating="AA",
+        carbon_intensity=40.0
+    )
+
+    xml = benchmark(bridge.create_setr_message, instrument, classification)
+
+    assert xml.endswith("</Document>")
@@ -0,0 +1,64 @@
+"""Scoring rules and array helpers shared by the ESG and ISO 20022 modules.
+
+The scalar rules here are also compiled by the Numba kernels in `_esg_numba`,
+so each rule is written once for the scalar, fused and batch paths.
+"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+# Lower bounds (inclusive) of each rating above D, in ascending order
+RATING_THRESHOLDS = (20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0, 85.0, 90.0)
+
+# Carbon intensity (tCO2e/$M revenue) at an environmental score of 0, falling
+# linearly to 0 at 100; computed as max - per_point * env (one multiply-subtract)
+MAX_CARBON_INTENSITY = 500.0
+CARBON_PER_POINT = MAX_CARBON_INTENSITY / 100.0
+
+
+def taxonomy_alignment(environmental: float) -> float:
+    """EU Taxonomy alignment percentage for an environmental score."""
+    if environmental >= 80.0:
+        return min(environmental, 100.0)
+    # Below 60 the scaled value is negative and clamps to no alignment
+    return max(0.0, (environmental - 60.0) * 2.0)
+
+
+def taxonomy_alignment_array(environmental):
+    """EU Taxonomy alignment for a float64 array of environmental scores."""
+    return np.where(
+        environmental >= 80.0,
+        np.minimum(environmental, 100.0),
+        np.where(environmental >= 60.0, (environmental - 60.0) * 2.0, 0.0),
+    )
+
+
+def carbon_intensity(environmental):
+    """Estimated carbon intensity for an environmental score or array of scores."""
+    return MAX_CARBON_INTENSITY - CARBON_PER_POINT * environmental
+
+
+def require_numpy():
+    """Raise an ImportError with an install hint if NumPy is missing."""
+    if np is None:
+        raise ImportError(
+            "Batch ESG scoring requires NumPy; install it with 'pip install erc8040-sdk[numpy]'"
+        )
+
+
+def component_arrays(environmental, social, governance):
+    """Convert component scores to broadcast float64 arrays within 0-100.
+
+    Raises:
+        ValueError: If the shapes cannot be broadcast together or any score
+            is outside 0-100
+    """
+    require_numpy()
+    components = np.broadcast_arrays(
+        *(np.asarray(values, dtype=np.float64) for values in (environmental, social, governance))
+    )
+    for values in components:
+        if not np.all((values >= 0.0) & (values <= 100.0)):
+            raise ValueError("ESG component scores must be between 0 and 100")
+    return components
@@ -0,0 +1,126 @@
+"""Batch ESG classification kernels.
+
+Uses Numba-compiled kernels when Numba is installed and falls back to
+NumPy otherwise. Both paths give the same results as the scalar
+`ESGRating.from_score` and `ISO20022Bridge.esg_to_iso` applied element-wise.
+"""
+import numpy as np
+
+from erc8040_sdk._common import carbon_intensity, taxonomy_alignment, taxonomy_alignment_array
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+
+if njit is not None:
+    # The scalar rules are compiled as-is, so the kernels cannot drift from them
+    _taxonomy_alignment_jit = njit(cache=True)(taxonomy_alignment)
+    _carbon_intensity_jit = njit(cache=True)(carbon_intensity)
+
+    @njit(cache=True)
+    def _rating_index(score, thresholds):
+        index = 0
+        for threshold in thresholds:
+            # Written as not >= so NaN stays at D, like from_score
+            if not score >= threshold:
+                break
+            index += 1
+        return index
+
+    @njit(cache=True, parallel=True)
+    def _classify_scores_jit(scores, thresholds, out):
+        for i in prange(scores.shape[0]):
+            out[i] = _rating_index(scores[i], thresholds)
+
+    @njit(cache=True, parallel=True)
+    def _esg_to_iso_jit(env, soc, gov, thresholds, sfdr_by_rating, tax, sfdr, rating, carbon):
+        for i in prange(env.shape[0]):
+            e = env[i]
+            index = _rating_index((e + soc[i] + gov[i]) / 3.0, thresholds)
+            tax[i] = _taxonomy_alignment_jit(e)
+            rating[i] = index
+            sfdr[i] = sfdr_by_rating[index]
+            carbon[i] = _carbon_intensity_jit(e)
+
+else:  # pragma: no cover - optional dependency
+    _classify_scores_jit = None
+    _esg_to_iso_jit = None
+
+
+def _classify_scores_numpy(scores: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    indices = np.asarray(np.searchsorted(thresholds, scores, side="right"), dtype=np.int8)
+    # searchsorted orders NaN last; from_score treats it as below every threshold
+    indices[np.isnan(scores)] = 0
+    return indices
+
+
+def classify_scores(scores, thresholds) -> np.ndarray:
+    """Map scores to rating indices (0 for D up to len(thresholds) for AAA).
+
+    Args:
+        scores: Array-like of total ESG scores
+        thresholds: Ascending inclusive lower bounds of each rating above D
+
+    Returns:
+        int8 array of rating indices with the same shape as `scores`
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+
+    if _classify_scores_jit is None:
+        return _classify_scores_numpy(scores, thresholds)
+
+    flat = np.ascontiguousarray(scores).ravel()
+    out = np.empty(flat.shape[0], dtype=np.int8)
+    _classify_scores_jit(flat, thresholds, out)
+    return out.reshape(scores.shape)
+
+
+def esg_to_iso_arrays(env, soc, gov, thresholds, sfdr_by_rating):
+    """Compute ISO 20022 classification columns for arrays of component scores.
+
+    Args:
+        env: 1-D float64 array of environmental scores
+        soc: 1-D float64 array of social scores
+        gov: 1-D float64 array of governance scores
+        thresholds: Ascending inclusive lower bounds of each rating above D
+        sfdr_by_rating: SFDR article for each rating index
+
+    Returns:
+        Tuple of (taxonomy alignment, SFDR article, rating index, carbon
+        intensity) arrays
+    """
+    if not env.shape == soc.shape == gov.shape:
+        # The kernel reads soc and gov by env's indices without bounds checks
+        raise ValueError("ESG component arrays must have the same shape")
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    sfdr_by_rating = np.asarray(sfdr_by_rating, dtype=np.int8)
+
+    if _esg_to_iso_jit is None:
+        rating = _classify_scores_numpy((env + soc + gov) / 3.0, thresholds)
+        return (
+            taxonomy_alignment_array(env),
+            sfdr_by_rating[rating],
+            rating,
+            carbon_intensity(env),
+        )
+
+    n = env.shape[0]
+    tax = np.empty(n, dtype=np.float64)
+    sfdr = np.empty(n, dtype=np.int8)
+    rating = np.empty(n, dtype=np.int8)
+    carbon = np.empty(n, dtype=np.float64)
+    _esg_to_iso_jit(
+        np.ascontiguousarray(env),
+        np.ascontiguousarray(soc),
+        np.ascontiguousarray(gov),
+        thresholds,
+        sfdr_by_rating,
+        tax,
+        sfdr,
+        rating,
+        carbon,
+    )
+    return tax, sfdr, rating, carbon
@@ -1,8 +1,30 @@
 """Compliance validation and regulatory framework module for ERC-8040."""
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
+
+from erc8040_sdk.esg import ESGRating, ESGScore
+
+# Position of each rating from D (lowest) to AAA (highest)
+_RATING_ORDINAL = {rating: i for i, rating in enumerate(ESGRating)}
+_RATING_BY_STR = {rating.value: rating for rating in ESGRating}
+
+_FRAMEWORK_DISPLAY_NAMES = {
+    "EU_SFDR": "EU SFDR",
+    "EU_Taxonomy": "EU Taxonomy",
+    "SEC_Climate": "SEC Climate",
+    "MiFID_II": "MiFID II",
+    "Basel": "Basel",
+}
+
+# Jurisdictions whose code differs from their value
+_JURISDICTION_CODES = {
+    "BRAZIL": "BR",
+}
 
 
 class RegulatoryFramework(str, Enum):
@@ -16,14 +38,7 @@ class RegulatoryFramework(str, Enum):
 
     def display_name(self) -> str:
         """Get the display name for the framework."""
-        mapping = {
-            "EU_SFDR": "EU SFDR",
-            "EU_Taxonomy": "EU Taxonomy",
-            "SEC_Climate": "SEC Climate",
-            "MiFID_II": "MiFID II",
-            "Basel": "Basel",
-        }
-        return mapping.get(self.value, self.value)
+        return _FRAMEWORK_DISPLAY_NAMES.get(self.value, self.value)
 
 
 class Jurisdiction(str, Enum):
@@ -37,14 +52,7 @@ class Jurisdiction(str, Enum):
 
     def code(self) -> str:
         """Get the jurisdiction code."""
-        mapping = {
-            "EU": "EU",
-            "US": "US",
-            "UK": "UK",
-            "BRAZIL": "BR",
-            "GLOBAL": "GLOBAL",
-        }
-        return mapping.get(self.value, self.value)
+        return _JURISDICTION_CODES.get(self.value, self.value)
 
 
 class Severity(str, Enum):
@@ -66,6 +74,18 @@ class ComplianceStatus(str, Enum):
     NOT_APPLICABLE = "not_applicable"
 
 
+# Precedence used when aggregating results, lowest to highest
+_STATUS_PRECEDENCE = (
+    ComplianceStatus.NOT_APPLICABLE,
+    ComplianceStatus.COMPLIANT,
+    ComplianceStatus.PARTIALLY_COMPLIANT,
+    ComplianceStatus.PENDING,
+    ComplianceStatus.NON_COMPLIANT,
+)
+_STATUS_PRIORITY = {status: i for i, status in enumerate(_STATUS_PRECEDENCE)}
+_MAX_STATUS_PRIORITY = _STATUS_PRIORITY[ComplianceStatus.NON_COMPLIANT]
+
+
 class RuleCategory(str, Enum):
     """Category of compliance rule."""
 
@@ -77,7 +97,13 @@ class RuleCategory(str, Enum):
 
 
 class ComplianceRule(BaseModel):
-    """A compliance rule that must be satisfied."""
+    """A compliance rule that must be satisfied.
+
+    Rules are immutable once created, since validators index them by their
+    framework, jurisdiction, category and effective dates.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     id: str
     framework: RegulatoryFramework
@@ -101,9 +127,8 @@ class ComplianceRule(BaseModel):
         check_time = at_time or datetime.now()
         if check_time < self.effective_from:
             return False
-        if self.effective_until and check_time > self.effective_until:
-            return False
-        return True
+        until = self.effective_until
+        return until is None or check_time <= until
 
     def applies_to(self, jurisdiction: Jurisdiction) -> bool:
         """Check if the rule applies to a specific jurisdiction.
@@ -117,21 +142,151 @@ class ComplianceRule(BaseModel):
         return self.jurisdiction == jurisdiction or self.jurisdiction == Jurisdiction.GLOBAL
 
 
-class ComplianceResult(BaseModel):
-    """Result of a compliance validation."""
+@dataclass(slots=True)
+class ComplianceResult:
+    """Result of a compliance validation.
+
+    Attributes:
+        rule_id: Identifier of the evaluated rule
+        status: Outcome of the check
+        message: Human-readable explanation of the outcome
+        checked_at: When the check ran. Results produced by one validation
+            call share the time that call started; results created directly
+            default to their own creation time.
+    """
 
     rule_id: str
     status: ComplianceStatus
     message: str
-    checked_at: datetime = Field(default_factory=datetime.now)
+    checked_at: datetime = field(default_factory=datetime.now)
+
+    def to_dict(self) -> dict:
+        """Serialize the result to a JSON-compatible dictionary."""
+        return {
+            "rule_id": self.rule_id,
+            # status may be given as its plain string value
+            "status": ComplianceStatus(self.status).value,
+            "message": self.message,
+            "checked_at": self.checked_at.isoformat(),
+        }
+
+
+_MSG_NOT_EFFECTIVE = "Rule not currently effective"
+_MSG_NOT_APPLICABLE = "Rule not applicable for given filters"
+_MSG_NO_REQUIREMENT = "No ESG rating requirement"
+_MSG_INVALID_RATING = "Invalid required ESG rating"
+
+
+def _check_rule(
+    rule: ComplianceRule, esg_score: ESGScore, check_time: datetime
+) -> tuple[ComplianceStatus, str]:
+    """Check an ESG score against a single rule.
+
+    Returns:
+        Tuple of (status, message) for the rule
+    """
+    if not rule.is_effective(check_time):
+        return ComplianceStatus.NOT_APPLICABLE, _MSG_NOT_EFFECTIVE
+    if rule.required_esg_rating is None:
+        return ComplianceStatus.NOT_APPLICABLE, _MSG_NO_REQUIREMENT
+    return _check_rating(rule, esg_score)
+
+
+def _check_rating(rule: ComplianceRule, esg_score: ESGScore) -> tuple[ComplianceStatus, str]:
+    """Check an ESG score against the rating requirement of an in-effect rule."""
+    required_rating = _RATING_BY_STR.get(rule.required_esg_rating)
+    if required_rating is None:
+        return ComplianceStatus.NON_COMPLIANT, _MSG_INVALID_RATING
+    if _RATING_ORDINAL[esg_score.rating] >= _RATING_ORDINAL[required_rating]:
+        return (
+            ComplianceStatus.COMPLIANT,
+            f"ESG rating {esg_score.rating.value} meets requirement",
+        )
+    return (
+        ComplianceStatus.NON_COMPLIANT,
+        f"ESG rating {esg_score.rating.value} does not meet "
+        f"requirement of {rule.required_esg_rating}",
+    )
+
+
+def _evaluate_rules(
+    rules: list[ComplianceRule],
+    esg_score: ESGScore,
+    checked_at: datetime,
+) -> list[ComplianceResult]:
+    """Evaluate an ESG score against in-effect rules carrying a rating requirement.
+
+    Args:
+        rules: Rules to evaluate
+        esg_score: ESG score to validate
+        checked_at: Timestamp recorded on every result
+
+    Returns:
+        One compliance result per rule, in order
+    """
+    results = [None] * len(rules)
+    for i, rule in enumerate(rules):
+        status, message = _check_rating(rule, esg_score)
+        results[i] = ComplianceResult(
+            rule_id=rule.id,
+            status=status,
+            message=message,
+            checked_at=checked_at,
+        )
+
+    return results
+
+
+class _RuleBucket:
+    """Rules sharing a (framework, jurisdiction, category) key.
+
+    Rules are kept sorted by effective_from (insertion order on ties) with a
+    parallel list of start times, so the rules already in effect at a given
+    time are a prefix found by bisection. Only buckets holding rules
+    with an effective_until need a second pass to drop expired rules.
+    """
+
+    __slots__ = ("rules", "starts", "expiring")
+
+    def __init__(self):
+        self.rules: list[ComplianceRule] = []
+        self.starts: list[datetime] = []
+        self.expiring = 0
+
+    def add(self, rule: ComplianceRule) -> None:
+        start = rule.effective_from
+        i = bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.rules.insert(i, rule)
+        if rule.effective_until is not None:
+            self.expiring += 1
+
+    def effective_at(self, check_time: datetime) -> list[ComplianceRule]:
+        started = self.rules[: bisect_right(self.starts, check_time)]
+        if not self.expiring:
+            return started
+        return [
+            rule
+            for rule in started
+            if rule.effective_until is None or check_time <= rule.effective_until
+        ]
 
 
 class ComplianceValidator:
-    """Validator for compliance rules."""
+    """Validator for compliance rules.
+
+    Rules carrying an ESG rating requirement are indexed by (framework,
+    jurisdiction, category) and effective_from as they are added, so rules must
+    be registered through `add_rule`/`add_rules` rather than by mutating
+    `rules` directly.
+    """
 
     def __init__(self):
         """Initialize a new compliance validator."""
         self.rules: list[ComplianceRule] = []
+        self._index: dict[
+            tuple[RegulatoryFramework, Jurisdiction, RuleCategory], _RuleBucket
+        ] = defaultdict(_RuleBucket)
 
     def add_rule(self, rule: ComplianceRule) -> None:
         """Add a compliance rule.
@@ -140,6 +295,7 @@ class ComplianceValidator:
             rule: Compliance rule to add
         """
         self.rules.append(rule)
+        self._index_rule(rule)
 
     def add_rules(self, rules: list[ComplianceRule]) -> None:
         """Add multiple compliance rules.
@@ -148,103 +304,97 @@ class ComplianceValidator:
             rules: List of compliance rules to add
         """
         self.rules.extend(rules)
+        for rule in rules:
+            self._index_rule(rule)
+
+    def _index_rule(self, rule: ComplianceRule) -> None:
+        """Insert a rule into its (framework, jurisdiction, category) bucket."""
+        # Rules without a rating requirement never yield a reported result
+        if rule.required_esg_rating is None:
+            return
+        self._index[(rule.framework, rule.jurisdiction, rule.category)].add(rule)
+
+    def _candidates(
+        self,
+        jurisdiction: Jurisdiction,
+        framework: RegulatoryFramework,
+        category: RuleCategory,
+        check_time: datetime,
+    ) -> list[ComplianceRule]:
+        """Get the indexed rules matching the filters that are in effect at `check_time`."""
+        candidates = []
+        bucket = self._index.get((framework, jurisdiction, category))
+        if bucket is not None:
+            candidates.extend(bucket.effective_at(check_time))
+        if jurisdiction != Jurisdiction.GLOBAL:
+            bucket = self._index.get((framework, Jurisdiction.GLOBAL, category))
+            if bucket is not None:
+                candidates.extend(bucket.effective_at(check_time))
+        return candidates
 
     def validate_esg(
         self,
-        esg_score,
+        esg_score: ESGScore,
         jurisdiction: Jurisdiction,
         framework: RegulatoryFramework,
         category: RuleCategory,
         at_time: datetime | None = None,
+        emit_not_applicable: bool = False,
     ) -> list[ComplianceResult]:
         """Validate an ESG score against ESG-related rules.
 
         Args:
-            esg_score: ESG score to validate (ESGScore object)
+            esg_score: ESG score to validate
             jurisdiction: Jurisdiction to validate against
             framework: Regulatory framework to validate against
             category: Rule category to validate against
             at_time: Time to check rules (defaults to now)
+            emit_not_applicable: Also report NOT_APPLICABLE results, one per
+                registered rule in insertion order, for rules that are not in
+                effect, do not match the filters or carry no rating requirement
 
         Returns:
-            List of compliance results
+            List of compliance results for the in-effect rules matching the
+            jurisdiction (or GLOBAL), framework and category filters that carry
+            an ESG rating requirement, all stamped with the same checked_at
         """
-        check_time = at_time or datetime.now()
-        results = []
-
-        for rule in self.rules:
-            if not rule.is_effective(check_time):
-                results.append(
-                    ComplianceResult(
-                        rule_id=rule.id,
-                        status=ComplianceStatus.NOT_APPLICABLE,
-                        message="Rule not currently effective",
-                    )
-                )
-                continue
-
-            if (
-                not rule.applies_to(jurisdiction)
-                or rule.framework != framework
-                or rule.category != category
+        checked_at = datetime.now()
+        check_time = at_time or checked_at
+
+        if emit_not_applicable:
+            return self._validate_all_rules(
+                esg_score, jurisdiction, framework, category, check_time, checked_at
+            )
+
+        candidates = self._candidates(jurisdiction, framework, category, check_time)
+        return _evaluate_rules(candidates, esg_score, checked_at)
+
+    def _validate_all_rules(
+        self,
+        esg_score: ESGScore,
+        jurisdiction: Jurisdiction,
+        framework: RegulatoryFramework,
+        category: RuleCategory,
+        check_time: datetime,
+        checked_at: datetime,
+    ) -> list[ComplianceResult]:
+        """Evaluate every registered rule, reporting unmatched ones as NOT_APPLICABLE."""
+        results = [None] * len(self.rules)
+        for i, rule in enumerate(self.rules):
+            if rule.is_effective(check_time) and not (
+                rule.applies_to(jurisdiction)
+                and rule.framework == framework
+                and rule.category == category
             ):
-                results.append(
-                    ComplianceResult(
-                        rule_id=rule.id,
-                        status=ComplianceStatus.NOT_APPLICABLE,
-                        message="Rule not applicable for given filters",
-                    )
-                )
-                continue
-
-            if rule.required_esg_rating is None:
-                results.append(
-                    ComplianceResult(
-                        rule_id=rule.id,
-                        status=ComplianceStatus.NOT_APPLICABLE,
-                        message="No ESG rating requirement",
-                    )
-                )
-                continue
-
-            # Import ESGRating here to avoid circular import
-            from erc8040_sdk.esg import ESGRating
-
-            try:
-                required_rating = ESGRating(rule.required_esg_rating)
-            except ValueError:
-                results.append(
-                    ComplianceResult(
-                        rule_id=rule.id,
-                        status=ComplianceStatus.NON_COMPLIANT,
-                        message="Invalid required ESG rating",
-                    )
-                )
-                continue
-
-            rating_order = list(ESGRating)
-
-            if rating_order.index(esg_score.rating) >= rating_order.index(required_rating):
-                results.append(
-                    ComplianceResult(
-                        rule_id=rule.id,
-                        status=ComplianceStatus.COMPLIANT,
-                        message=f"ESG rating {esg_score.rating.value} meets requirement",
-                    )
-                )
+                status, message = ComplianceStatus.NOT_APPLICABLE, _MSG_NOT_APPLICABLE
             else:
-                message = (
-                    f"ESG rating {esg_score.rating.value} does not meet "
-                    f"requirement of {rule.required_esg_rating}"
-                )
-                results.append(
-                    ComplianceResult(
-                        rule_id=rule.id,
-                        status=ComplianceStatus.NON_COMPLIANT,
-                        message=message,
-                    )
-                )
-
+                status, message = _check_rule(rule, esg_score, check_time)
+            results[i] = ComplianceResult(
+                rule_id=rule.id,
+                status=status,
+                message=message,
+                checked_at=checked_at,
+            )
         return results
 
     def overall_status(self, results: list[ComplianceResult]) -> ComplianceStatus:
@@ -256,28 +406,13 @@ class ComplianceValidator:
         Returns:
             Overall compliance status
         """
-        has_non_compliant = False
-        has_partially_compliant = False
-        has_compliant = False
-        has_pending = False
-
+        best = 0
         for result in results:
-            if result.status == ComplianceStatus.NON_COMPLIANT:
-                has_non_compliant = True
-            elif result.status == ComplianceStatus.PARTIALLY_COMPLIANT:
-                has_partially_compliant = True
-            elif result.status == ComplianceStatus.COMPLIANT:
-                has_compliant = True
-            elif result.status == ComplianceStatus.PENDING:
-                has_pending = True
-
-        if has_non_compliant:
-            return ComplianceStatus.NON_COMPLIANT
-        elif has_pending:
-            return ComplianceStatus.PENDING
-        elif has_partially_compliant:
-            return ComplianceStatus.PARTIALLY_COMPLIANT
-        elif has_compliant:
-            return ComplianceStatus.COMPLIANT
-        else:
-            return ComplianceStatus.NOT_APPLICABLE
+            priority = _STATUS_PRIORITY.get(result.status, 0)
+            if priority == _MAX_STATUS_PRIORITY:
+                # Nothing outranks non-compliance
+                return ComplianceStatus.NON_COMPLIANT
+            if priority > best:
+                best = priority
+
+        return _STATUS_PRECEDENCE[best]
@@ -1,7 +1,16 @@
 """ESG scoring and rating module for ERC-8040."""
+from bisect import bisect_right
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from erc8040_sdk._common import RATING_THRESHOLDS, component_arrays, require_numpy
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
 
 
 class ESGCategory(str, Enum):
@@ -29,35 +38,48 @@ class ESGRating(str, Enum):
     @classmethod
     def from_score(cls, score: float) -> "ESGRating":
         """Convert a total ESG score (0-100) to a rating."""
-        if score >= 90.0:
-            return cls.AAA
-        elif score >= 85.0:
-            return cls.AA
-        elif score >= 80.0:
-            return cls.A
-        elif score >= 70.0:
-            return cls.BBB
-        elif score >= 60.0:
-            return cls.BB
-        elif score >= 50.0:
-            return cls.B
-        elif score >= 40.0:
-            return cls.CCC
-        elif score >= 30.0:
-            return cls.CC
-        elif score >= 20.0:
-            return cls.C
-        else:
+        if score != score:  # NaN is below every threshold
             return cls.D
+        return _RATINGS[bisect_right(RATING_THRESHOLDS, score)]
+
+    @classmethod
+    def from_scores_batch(cls, scores):
+        """Convert an array of total ESG scores to ratings in one pass.
+
+        Uses a Numba-compiled kernel when Numba is installed, otherwise NumPy.
+
+        Args:
+            scores: Array-like of total ESG scores (0-100)
+
+        Returns:
+            Object array of ESGRating members with the same shape as `scores`
+        """
+        require_numpy()
+        from erc8040_sdk._esg_numba import classify_scores
+
+        indices = classify_scores(scores, RATING_THRESHOLDS)
+        # asarray keeps a 0-d array for scalar input instead of a bare member
+        return np.asarray(np.array(_RATINGS, dtype=object)[indices], dtype=object)
 
     @property
     def is_investment_grade(self) -> bool:
         """Check if this rating is investment grade (BBB or higher)."""
-        return self in (ESGRating.AAA, ESGRating.AA, ESGRating.A, ESGRating.BBB)
+        return self in _INVESTMENT_GRADE
+
+
+# Ratings from D (lowest) to AAA (highest), aligned with RATING_THRESHOLDS
+_RATINGS = tuple(ESGRating)
+
+_INVESTMENT_GRADE = frozenset({ESGRating.AAA, ESGRating.AA, ESGRating.A, ESGRating.BBB})
 
 
 class ESGScore(BaseModel):
-    """ESG Score breakdown."""
+    """ESG Score breakdown.
+
+    Scores are immutable, so the same instance can be shared and cached.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     environmental: float = Field(ge=0.0, le=100.0)
     social: float = Field(ge=0.0, le=100.0)
@@ -70,6 +92,8 @@ class ESGScore(BaseModel):
         """Create a new ESG score with calculated total and rating."""
         total = (environmental + social + governance) / 3.0
         rating = ESGRating.from_score(total)
+        # Validated construction is kept on purpose: pydantic-core checks the
+        # bounds faster than model_construct() can skip them.
         return cls(
             environmental=environmental,
             social=social,
@@ -109,6 +133,11 @@ class ESGScoring:
         self.environmental_weight = environmental_weight / total
         self.social_weight = social_weight / total
         self.governance_weight = governance_weight / total
+        self._weights = (
+            self.environmental_weight,
+            self.social_weight,
+            self.governance_weight,
+        )
 
     def calculate(self, environmental: float, social: float, governance: float) -> ESGScore:
         """Calculate ESG score from individual component scores.
@@ -121,11 +150,8 @@ class ESGScoring:
         Returns:
             ESGScore with weighted total and rating
         """
-        weighted_total = (
-            environmental * self.environmental_weight
-            + social * self.social_weight
-            + governance * self.governance_weight
-        )
+        env_weight, soc_weight, gov_weight = self._weights
+        weighted_total = environmental * env_weight + social * soc_weight + governance * gov_weight
 
         rating = ESGRating.from_score(weighted_total)
 
@@ -136,3 +162,27 @@ class ESGScoring:
             total=weighted_total,
             rating=rating,
         )
+
+    def calculate_batch(self, environmental, social, governance):
+        """Calculate weighted totals and ratings for arrays of component scores.
+
+        Vectorized counterpart of `calculate` for scoring many instruments at
+        once. Requires NumPy.
+
+        Args:
+            environmental: Array-like of environmental scores (0-100)
+            social: Array-like of social scores (0-100)
+            governance: Array-like of governance scores (0-100)
+
+        Returns:
+            Tuple of (totals, ratings): a float64 array of weighted totals and
+            an object array of the matching ESGRating members
+
+        Raises:
+            ValueError: If the component shapes cannot be broadcast together
+                or any component score is outside 0-100
+        """
+        env, soc, gov = component_arrays(environmental, social, governance)
+        env_weight, soc_weight, gov_weight = self._weights
+        totals = env * env_weight + soc * soc_weight + gov * gov_weight
+        return totals, ESGRating.from_scores_batch(totals)
@@ -0,0 +1,26 @@
+"""Shared fixtures for SDK tests."""
+
+import pytest
+
+from erc8040_sdk import ISO20022Bridge
+
+
+@pytest.fixture(scope="module")
+def bridge():
+    """Shared ISO 20022 bridge; it holds no per-call state."""
+    return ISO20022Bridge()
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def batch_backend(request, monkeypatch):
+    """Run a batch test against the Numba kernels and against the NumPy fallback."""
+    pytest.importorskip("numpy")
+    from erc8040_sdk import _esg_numba
+
+    if request.param == "numba":
+        if _esg_numba.njit is None:
+            pytest.skip("Numba is not installed")
+    else:
+        monkeypatch.setattr(_esg_numba, "_classify_scores_jit", None)
+        monkeypatch.setattr(_esg_numba, "_esg_to_iso_jit", None)
+    return request.param
@@ -47,6 +47,104 @@ def test_compliance_rule_is_effective():
     assert not rule.is_effective(now + timedelta(days=20))
 
 
+def test_compliance_rule_is_immutable():
+    """Test compliance rules cannot be modified after creation."""
+    import pytest
+    from pydantic import ValidationError
+
+    rule = ComplianceRule(
+        id="TEST-001",
+        framework=RegulatoryFramework.EU_SFDR,
+        jurisdiction=Jurisdiction.EU,
+        category=RuleCategory.ESG_DISCLOSURE,
+        severity=Severity.HIGH,
+        description="Test rule",
+        effective_from=datetime.now(),
+        required_esg_rating="BBB",
+    )
+
+    with pytest.raises(ValidationError):
+        rule.jurisdiction = Jurisdiction.US
+
+
+def test_compliance_rule_copy_uses_updated_dates():
+    """Test model_copy with new effective dates is checked and indexed by them."""
+    now = datetime.now()
+    rule = ComplianceRule(
+        id="TEST-001",
+        framework=RegulatoryFramework.EU_SFDR,
+        jurisdiction=Jurisdiction.EU,
+        category=RuleCategory.ESG_DISCLOSURE,
+        severity=Severity.HIGH,
+        description="Test rule",
+        effective_from=now - timedelta(days=1),
+        required_esg_rating="BBB",
+    )
+    assert rule.is_effective(now)
+
+    future = rule.model_copy(update={"effective_from": now + timedelta(days=30)})
+    assert not future.is_effective(now)
+
+    validator = ComplianceValidator()
+    validator.add_rule(future)
+    results = validator.validate_esg(
+        ESGScore.create(90.0, 85.0, 80.0),
+        Jurisdiction.EU,
+        RegulatoryFramework.EU_SFDR,
+        RuleCategory.ESG_DISCLOSURE,
+        at_time=now,
+    )
+    assert results == []
+
+
+def test_compliance_rule_copy_uses_updated_rating():
+    """Test model_copy with a new required rating is checked against it."""
+    rule = ComplianceRule(
+        id="TEST-001",
+        framework=RegulatoryFramework.EU_SFDR,
+        jurisdiction=Jurisdiction.EU,
+        category=RuleCategory.ESG_DISCLOSURE,
+        severity=Severity.HIGH,
+        description="Test rule",
+        effective_from=datetime.now() - timedelta(days=1),
+        required_esg_rating="BBB",
+    )
+    validator = ComplianceValidator()
+    validator.add_rule(rule.model_copy(update={"required_esg_rating": "AAA"}))
+
+    results = validator.validate_esg(
+        ESGScore.create(82.0, 80.0, 78.0),  # A
+        Jurisdiction.EU,
+        RegulatoryFramework.EU_SFDR,
+        RuleCategory.ESG_DISCLOSURE,
+    )
+    assert [r.status for r in results] == [ComplianceStatus.NON_COMPLIANT]
+
+
+def test_compliance_rule_effective_from_datetime_min():
+    """Test a rule effective since datetime.min is always in effect."""
+    rule = ComplianceRule(
+        id="TEST-001",
+        framework=RegulatoryFramework.EU_SFDR,
+        jurisdiction=Jurisdiction.EU,
+        category=RuleCategory.ESG_DISCLOSURE,
+        severity=Severity.HIGH,
+        description="Test rule",
+        effective_from=datetime.min,
+        required_esg_rating="BBB",
+    )
+    validator = ComplianceValidator()
+    validator.add_rule(rule)
+
+    results = validator.validate_esg(
+        ESGScore.create(90.0, 85.0, 80.0),
+        Jurisdiction.EU,
+        RegulatoryFramework.EU_SFDR,
+        RuleCategory.ESG_DISCLOSURE,
+    )
+    assert [r.status for r in results] == [ComplianceStatus.COMPLIANT]
+
+
 def test_compliance_rule_applies_to():
     """Test jurisdiction applicability."""
     rule = ComplianceRule(
@@ -185,3 +283,172 @@ def test_compliance_validator_invalid_required_rating():
 
     assert len(results) == 1
     assert results[0].status == ComplianceStatus.NON_COMPLIANT
+
+
+def test_compliance_validator_validate_esg_filters_rules():
+    """Test that only rules matching the filters (or GLOBAL) are evaluated."""
+    validator = ComplianceValidator()
+    now = datetime.now()
+
+    def make_rule(rule_id, jurisdiction, framework, effective_from=now):
+        return ComplianceRule(
+            id=rule_id,
+            framework=framework,
+            jurisdiction=jurisdiction,
+            category=RuleCategory.ESG_DISCLOSURE,
+            severity=Severity.HIGH,
+            description="Minimum ESG rating required",
+            effective_from=effective_from,
+            required_esg_rating="BBB",
+        )
+
+    validator.add_rules(
+        [
+            make_rule("EU-001", Jurisdiction.EU, RegulatoryFramework.EU_SFDR),
+            make_rule("US-001", Jurisdiction.US, RegulatoryFramework.EU_SFDR),
+            make_rule("SEC-001", Jurisdiction.EU, RegulatoryFramework.SEC_CLIMATE),
+            make_rule("GLOBAL-001", Jurisdiction.GLOBAL, RegulatoryFramework.EU_SFDR),
+            make_rule(
+                "EU-FUTURE",
+                Jurisdiction.EU,
+                RegulatoryFramework.EU_SFDR,
+                effective_from=now + timedelta(days=30),
+            ),
+        ]
+    )
+
+    esg_score = ESGScore.create(85.0, 80.0, 75.0)
+    results = validator.validate_esg(
+        esg_score,
+        Jurisdiction.EU,
+        RegulatoryFramework.EU_SFDR,
+        RuleCategory.ESG_DISCLOSURE,
+        at_time=now,
+    )
+
+    statuses = {result.rule_id: result.status for result in results}
+    assert statuses == {
+        "EU-001": ComplianceStatus.COMPLIANT,
+        "GLOBAL-001": ComplianceStatus.COMPLIANT,
+    }
+
+    all_results = validator.validate_esg(
+        esg_score,
+        Jurisdiction.EU,
+        RegulatoryFramework.EU_SFDR,
+        RuleCategory.ESG_DISCLOSURE,
+        at_time=now,
+        emit_not_applicable=True,
+    )
+
+    assert [(result.rule_id, result.status, result.message) for result in all_results] == [
+        ("EU-001", ComplianceStatus.COMPLIANT, "ESG rating A meets requirement"),
+        ("US-001", ComplianceStatus.NOT_APPLICABLE, "Rule not applicable for given filters"),
+        ("SEC-001", ComplianceStatus.NOT_APPLICABLE, "Rule not applicable for given filters"),
+        ("GLOBAL-001", ComplianceStatus.COMPLIANT, "ESG rating A meets requirement"),
+        ("EU-FUTURE", ComplianceStatus.NOT_APPLICABLE, "Rule not currently effective"),
+    ]
+
+
+def test_compliance_result_to_dict():
+    """Test compliance result serialization."""
+    from erc8040_sdk.compliance import ComplianceResult
+
+    checked_at = datetime(2024, 1, 1, 12, 0, 0)
+    result = ComplianceResult(
+        rule_id="R1",
+        status=ComplianceStatus.COMPLIANT,
+        message="OK",
+        checked_at=checked_at,
+    )
+
+    assert result.to_dict() == {
+        "rule_id": "R1",
+        "status": "compliant",
+        "message": "OK",
+        "checked_at": "2024-01-01T12:00:00",
+    }
+
+    from_string = ComplianceResult(rule_id="R1", status="compliant", message="OK")
+    assert from_string.to_dict()["status"] == "compliant"
+
+
+def test_compliance_validator_overall_status_precedence():
+    """Test status precedence when aggregating results."""
+    from erc8040_sdk.compliance import ComplianceResult
+
+    validator = ComplianceValidator()
+
+    def results_for(*statuses):
+        return [
+            ComplianceResult(rule_id=f"R{i}", status=status, message="")
+            for i, status in enumerate(statuses)
+        ]
+
+    assert validator.overall_status([]) == ComplianceStatus.NOT_APPLICABLE
+    assert (
+        validator.overall_status(
+            results_for(ComplianceStatus.NOT_APPLICABLE, ComplianceStatus.COMPLIANT)
+        )
+        == ComplianceStatus.COMPLIANT
+    )
+    assert (
+        validator.overall_status(
+            results_for(
+                ComplianceStatus.PARTIALLY_COMPLIANT,
+                ComplianceStatus.PENDING,
+                ComplianceStatus.COMPLIANT,
+            )
+        )
+        == ComplianceStatus.PENDING
+    )
+    assert (
+        validator.overall_status(
+            results_for(ComplianceStatus.NON_COMPLIANT, ComplianceStatus.PENDING)
+        )
+        == ComplianceStatus.NON_COMPLIANT
+    )
+
+
+def test_enum_display_helpers():
+    """Test framework display names and jurisdiction codes."""
+    assert RegulatoryFramework.EU_SFDR.display_name() == "EU SFDR"
+    assert RegulatoryFramework.MIFID_II.display_name() == "MiFID II"
+    assert RegulatoryFramework.BASEL.display_name() == "Basel"
+    assert Jurisdiction.BRAZIL.code() == "BR"
+    assert Jurisdiction.EU.code() == "EU"
+    assert Jurisdiction.GLOBAL.code() == "GLOBAL"
+
+
+def test_compliance_validator_results_share_checked_at():
+    """Test results from one validation share the wall-clock check time."""
+    validator = ComplianceValidator()
+    validator.add_rules(
+        [
+            ComplianceRule(
+                id=f"SFDR-{i:03d}",
+                framework=RegulatoryFramework.EU_SFDR,
+                jurisdiction=Jurisdiction.EU,
+                category=RuleCategory.ESG_DISCLOSURE,
+                severity=Severity.HIGH,
+                description="Minimum ESG rating required",
+                effective_from=datetime(2023, 1, 1),
+                required_esg_rating="BBB",
+            )
+            for i in range(3)
+        ]
+    )
+
+    before = datetime.now()
+    results = validator.validate_esg(
+        ESGScore.create(85.0, 80.0, 75.0),
+        Jurisdiction.EU,
+        RegulatoryFramework.EU_SFDR,
+        RuleCategory.ESG_DISCLOSURE,
+        at_time=datetime(2024, 1, 1),
+    )
+    after = datetime.now()
+
+    assert len(results) == 3
+    assert len({result.checked_at for result in results}) == 1
+    assert before <= results[0].checked_at <= after
@@ -1,5 +1,7 @@
 """Tests for ESG scoring and rating functionality."""
 
+from pytest import approx
+
 from erc8040_sdk import ESGRating, ESGScore, ESGScoring
 
 
@@ -31,7 +33,7 @@ def test_esg_score_create():
     assert score.environmental == 90.0
     assert score.social == 85.0
     assert score.governance == 80.0
-    assert abs(score.total - 85.0) < 0.01
+    assert score.total == approx(85.0, abs=1e-2)
     assert score.rating == ESGRating.AA
 
 
@@ -40,7 +42,7 @@ def test_esg_scoring_custom_weights():
     scoring = ESGScoring(environmental_weight=2.0, social_weight=1.0, governance_weight=1.0)
     score = scoring.calculate(80.0, 60.0, 60.0)
     # (80*0.5 + 60*0.25 + 60*0.25) = 70
-    assert abs(score.total - 70.0) < 0.01
+    assert score.total == approx(70.0, abs=1e-2)
 
 
 def test_esg_score_is_investment_grade():
@@ -61,3 +63,109 @@ def test_esg_scoring_invalid_weights():
 
     with pytest.raises(ValueError):
         ESGScoring(environmental_weight=0.0, social_weight=0.0, governance_weight=0.0)
+
+
+def test_esg_scoring_calculate_batch():
+    """Test batch scoring matches scalar scoring."""
+    import pytest
+
+    np = pytest.importorskip("numpy")
+
+    scoring = ESGScoring(environmental_weight=2.0, social_weight=1.0, governance_weight=1.0)
+    env = [95.0, 80.0, 60.0, 45.0, 10.0, 0.0, 100.0]
+    soc = [90.0, 60.0, 55.0, 50.0, 20.0, 0.0, 100.0]
+    gov = [92.0, 60.0, 70.0, 30.0, 15.0, 0.0, 100.0]
+
+    totals, ratings = scoring.calculate_batch(np.array(env), np.array(soc), np.array(gov))
+
+    for i, triple in enumerate(zip(env, soc, gov, strict=True)):
+        expected = scoring.calculate(*triple)
+        assert totals[i] == approx(expected.total, abs=1e-9)
+        assert ratings[i] == expected.rating
+
+    with pytest.raises(ValueError):
+        scoring.calculate_batch([101.0], [50.0], [50.0])
+
+
+def test_esg_rating_from_scores_batch(batch_backend):
+    """Test batch rating classification matches from_score, NaN included."""
+    import numpy as np
+
+    scores = np.array(
+        [
+            0.0, 19.99, 20.0, 30.0, 39.9, 40.0, 50.0, 60.0,
+            70.0, 79.9, 80.0, 85.0, 89.9, 90.0, 100.0, float("nan"),
+        ]
+    )
+    ratings = ESGRating.from_scores_batch(scores)
+
+    assert list(ratings) == [ESGRating.from_score(score) for score in scores]
+    assert ratings[-1] == ESGRating.D
+
+
+def test_esg_rating_from_scores_batch_keeps_shape(batch_backend):
+    """Test batch classification returns an object array shaped like its input."""
+    import numpy as np
+
+    scalar = ESGRating.from_scores_batch(55.0)
+    assert isinstance(scalar, np.ndarray)
+    assert scalar.shape == ()
+    assert scalar.item() == ESGRating.B
+
+    grid = ESGRating.from_scores_batch([[10.0, 95.0], [45.0, 72.0]])
+    assert grid.shape == (2, 2)
+    assert grid.tolist() == [[ESGRating.D, ESGRating.AAA], [ESGRating.CCC, ESGRating.BBB]]
+
+
+def test_esg_rating_from_score_boundaries():
+    """Test rating thresholds are sorted and inclusive at each boundary."""
+    from erc8040_sdk._common import RATING_THRESHOLDS
+
+    assert list(RATING_THRESHOLDS) == sorted(set(RATING_THRESHOLDS))
+    assert len(RATING_THRESHOLDS) == len(ESGRating) - 1
+
+    expected = [
+        (0.0, ESGRating.D),
+        (19.99, ESGRating.D),
+        (20.0, ESGRating.C),
+        (30.0, ESGRating.CC),
+        (40.0, ESGRating.CCC),
+        (50.0, ESGRating.B),
+        (60.0, ESGRating.BB),
+        (70.0, ESGRating.BBB),
+        (80.0, ESGRating.A),
+        (85.0, ESGRating.AA),
+        (89.99, ESGRating.AA),
+        (90.0, ESGRating.AAA),
+        (100.0, ESGRating.AAA),
+        (float("nan"), ESGRating.D),
+    ]
+    for score, rating in expected:
+        assert ESGRating.from_score(score) == rating
+
+
+def test_esg_score_create_out_of_range():
+    """Test ESG score creation rejects out-of-range components."""
+    import pytest
+
+    with pytest.raises(ValueError):
+        ESGScore.create(101.0, 50.0, 50.0)
+
+    with pytest.raises(ValueError):
+        ESGScoring().calculate(50.0, -1.0, 50.0)
+
+    with pytest.raises(ValueError):
+        ESGScore.create(50.0, 50.0, float("nan"))
+
+
+def test_esg_score_is_immutable():
+    """Test ESG scores cannot be modified and are hashable."""
+    import pytest
+    from pydantic import ValidationError
+
+    score = ESGScore.create(90.0, 85.0, 80.0)
+
+    with pytest.raises(ValidationError):
+        score.environmental = 10.0
+
+    assert hash(score) == hash(ESGScore.create(90.0, 85.0, 80.0))
@@ -1,128 +1,226 @@
 """Tests for ISO 20022 bridge functionality."""
 
+import xml.etree.ElementTree as ET
+from functools import cache
+
+import pytest
+from pytest import approx
+
 from erc8040_sdk import (
     ESGClassification,
     ESGRating,
     ESGScore,
     FinancialInstrument,
-    ISO20022Bridge,
 )
 
+SETR_NS = {"s": "urn:iso:std:iso:20022:tech:xsd:setr.010.001.04"}
+SETR_FIELDS = {
+    "isin": "s:SctiesTradConf/s:FinInstrmId/s:ISIN",
+    "lei": "s:SctiesTradConf/s:FinInstrmId/s:LEI",
+    "nm": "s:SctiesTradConf/s:FinInstrmId/s:Nm",
+    "tax": "s:SctiesTradConf/s:ESGClssfctn/s:TaxnmyAlgnmt",
+    "sfdr": "s:SctiesTradConf/s:ESGClssfctn/s:SFDRArtcl",
+    "rtg": "s:SctiesTradConf/s:ESGClssfctn/s:ERC8040Rtg",
+}
+
+
+def parse_setr(xml):
+    """Parse a SETR message once and return its root and field values."""
+    root = ET.fromstring(xml)
+    fields = {name: root.findtext(path, namespaces=SETR_NS) for name, path in SETR_FIELDS.items()}
+    return root, fields
+
+
+@cache
+def _score(environmental, social, governance):
+    """Build each distinct (immutable) ESG score once per test session."""
+    return ESGScore.create(environmental, social, governance)
+
+
+@pytest.mark.parametrize(
+    "rating,expected",
+    [
+        (ESGRating.AAA, 9),
+        (ESGRating.AA, 9),
+        (ESGRating.A, 9),
+        (ESGRating.BBB, 8),
+        (ESGRating.BB, 8),
+        (ESGRating.B, 6),
+        (ESGRating.CCC, 6),
+        (ESGRating.CC, 6),
+        (ESGRating.C, 6),
+        (ESGRating.D, 6),
+    ],
+)
+def test_map_sfdr_article(bridge, rating, expected):
+    """Test SFDR mapping: Article 9 (A and up), 8 (BB, BBB), 6 (B and below)."""
+    assert bridge.map_sfdr_article(rating) == expected
 
-def test_map_sfdr_article_article_9():
-    """Test SFDR mapping for Article 9 ratings (AAA, AA, A)."""
-    bridge = ISO20022Bridge()
-
-    assert bridge.map_sfdr_article(ESGRating.AAA) == 9
-    assert bridge.map_sfdr_article(ESGRating.AA) == 9
-    assert bridge.map_sfdr_article(ESGRating.A) == 9
-
-
-def test_map_sfdr_article_article_8():
-    """Test SFDR mapping for Article 8 ratings (BBB, BB)."""
-    bridge = ISO20022Bridge()
-
-    assert bridge.map_sfdr_article(ESGRating.BBB) == 8
-    assert bridge.map_sfdr_article(ESGRating.BB) == 8
 
+def test_map_sfdr_article_table_is_read_only(bridge):
+    """Test the SFDR table cannot be modified and unknown ratings are rejected."""
+    from erc8040_sdk.iso20022 import _SFDR_ARTICLES
 
-def test_map_sfdr_article_article_6():
-    """Test SFDR mapping for Article 6 ratings (B and below)."""
-    bridge = ISO20022Bridge()
+    with pytest.raises(TypeError):
+        _SFDR_ARTICLES[ESGRating.D] = 9
 
-    assert bridge.map_sfdr_article(ESGRating.B) == 6
-    assert bridge.map_sfdr_article(ESGRating.CCC) == 6
-    assert bridge.map_sfdr_article(ESGRating.CC) == 6
-    assert bridge.map_sfdr_article(ESGRating.C) == 6
-    assert bridge.map_sfdr_article(ESGRating.D) == 6
+    with pytest.raises(KeyError):
+        bridge.map_sfdr_article("Z")
 
 
-def test_calculate_taxonomy_alignment_high_score():
+def test_calculate_taxonomy_alignment_high_score(bridge):
     """Test taxonomy alignment for high environmental scores (>= 80)."""
-    bridge = ISO20022Bridge()
-
-    score_90 = ESGScore.create(90.0, 85.0, 80.0)
+    score_90 = _score(90.0, 85.0, 80.0)
     assert bridge.calculate_taxonomy_alignment(score_90) == 90.0
 
-    score_85 = ESGScore.create(85.0, 80.0, 75.0)
+    score_85 = _score(85.0, 80.0, 75.0)
     assert bridge.calculate_taxonomy_alignment(score_85) == 85.0
 
-    score_80 = ESGScore.create(80.0, 75.0, 70.0)
+    score_80 = _score(80.0, 75.0, 70.0)
     assert bridge.calculate_taxonomy_alignment(score_80) == 80.0
 
 
-def test_calculate_taxonomy_alignment_medium_score():
+def test_calculate_taxonomy_alignment_medium_score(bridge):
     """Test taxonomy alignment for medium environmental scores (60-79)."""
-    bridge = ISO20022Bridge()
-
-    score_75 = ESGScore.create(75.0, 70.0, 68.0)
+    score_75 = _score(75.0, 70.0, 68.0)
     alignment = bridge.calculate_taxonomy_alignment(score_75)
-    assert abs(alignment - 30.0) < 0.01  # (75 - 60) * 2 = 30
+    assert alignment == approx(30.0, abs=1e-2)  # (75 - 60) * 2 = 30
 
-    score_65 = ESGScore.create(65.0, 60.0, 58.0)
+    score_65 = _score(65.0, 60.0, 58.0)
     alignment = bridge.calculate_taxonomy_alignment(score_65)
-    assert abs(alignment - 10.0) < 0.01  # (65 - 60) * 2 = 10
+    assert alignment == approx(10.0, abs=1e-2)  # (65 - 60) * 2 = 10
 
-    score_60 = ESGScore.create(60.0, 55.0, 50.0)
+    score_60 = _score(60.0, 55.0, 50.0)
     alignment = bridge.calculate_taxonomy_alignment(score_60)
-    assert abs(alignment - 0.0) < 0.01  # (60 - 60) * 2 = 0
+    assert alignment == approx(0.0, abs=1e-2)  # (60 - 60) * 2 = 0
 
 
-def test_calculate_taxonomy_alignment_low_score():
+def test_calculate_taxonomy_alignment_low_score(bridge):
     """Test taxonomy alignment for low environmental scores (< 60)."""
-    bridge = ISO20022Bridge()
-
-    score_50 = ESGScore.create(50.0, 45.0, 40.0)
+    score_50 = _score(50.0, 45.0, 40.0)
     assert bridge.calculate_taxonomy_alignment(score_50) == 0.0
 
-    score_30 = ESGScore.create(30.0, 25.0, 20.0)
+    score_30 = _score(30.0, 25.0, 20.0)
     assert bridge.calculate_taxonomy_alignment(score_30) == 0.0
 
 
-def test_esg_to_iso_high_performance():
-    """Test ESG to ISO conversion for high ESG performance."""
-    bridge = ISO20022Bridge()
-    score = ESGScore.create(90.0, 85.0, 80.0)
+@pytest.mark.parametrize(
+    "environmental,expected",
+    [(0.0, 0.0), (59.9, 0.0), (60.0, 0.0), (79.9, 39.8), (80.0, 80.0), (100.0, 100.0)],
+)
+def test_calculate_taxonomy_alignment_boundaries(bridge, environmental, expected):
+    """Test taxonomy alignment on either side of the 60 and 80 breakpoints."""
+    score = _score(environmental, 50.0, 50.0)
+    assert bridge.calculate_taxonomy_alignment(score) == approx(expected, abs=1e-2)
 
-    classification = bridge.esg_to_iso(score)
 
-    assert classification.taxonomy_alignment == 90.0
-    assert classification.sfdr_article == 9
-    assert classification.erc8040_rating == "AA"
-    assert classification.carbon_intensity is not None
-    assert abs(classification.carbon_intensity - 50.0) < 0.01  # 500 * (1 - 0.9)
+def test_calculate_taxonomy_alignment_batch(bridge):
+    """Test vectorized taxonomy alignment matches the scalar rule."""
+    np = pytest.importorskip("numpy")
 
+    envs = np.array([90.0, 85.0, 80.0, 75.0, 65.0, 60.0, 50.0, 30.0])
+    expected = np.array([90.0, 85.0, 80.0, 30.0, 10.0, 0.0, 0.0, 0.0])
 
-def test_esg_to_iso_medium_performance():
-    """Test ESG to ISO conversion for medium ESG performance."""
-    bridge = ISO20022Bridge()
-    score = ESGScore.create(75.0, 70.0, 68.0)
+    np.testing.assert_allclose(bridge.calculate_taxonomy_alignment_batch(envs), expected)
 
-    classification = bridge.esg_to_iso(score)
 
-    assert abs(classification.taxonomy_alignment - 30.0) < 0.01
-    assert classification.sfdr_article == 8
-    assert classification.erc8040_rating == "BBB"
-    assert abs(classification.carbon_intensity - 125.0) < 0.01  # 500 * (1 - 0.75)
+@pytest.mark.parametrize(
+    ("environmental", "social", "governance", "taxonomy", "sfdr", "rating", "carbon"),
+    [
+        (90.0, 85.0, 80.0, 90.0, 9, "AA", 50.0),
+        (75.0, 70.0, 68.0, 30.0, 8, "BBB", 125.0),
+        (45.0, 50.0, 48.0, 0.0, 6, "CCC", 275.0),
+        (100.0, 100.0, 100.0, 100.0, 9, "AAA", 0.0),
+        (50.0, 50.0, 50.0, 0.0, 6, "B", 250.0),
+        (0.0, 50.0, 50.0, 0.0, 6, "CC", 500.0),
+    ],
+)
+def test_esg_to_iso(
+    bridge, environmental, social, governance, taxonomy, sfdr, rating, carbon
+):
+    """Test ESG to ISO conversion across the performance range."""
+    classification = bridge.esg_to_iso(_score(environmental, social, governance))
 
+    assert classification.taxonomy_alignment == approx(taxonomy, abs=1e-2)
+    assert classification.sfdr_article == sfdr
+    assert classification.erc8040_rating == rating
+    # Carbon intensity falls as the environmental score rises
+    assert classification.carbon_intensity == approx(carbon, abs=1e-2)
 
-def test_esg_to_iso_low_performance():
-    """Test ESG to ISO conversion for low ESG performance."""
-    bridge = ISO20022Bridge()
-    score = ESGScore.create(45.0, 50.0, 48.0)
 
-    classification = bridge.esg_to_iso(score)
+def test_carbon_intensity_matches_linear_model(bridge):
+    """Test carbon intensity follows 500 * (1 - env / 100) across the range."""
+    for step in range(1001):
+        environmental = step / 10
+        score = _score(environmental, 50.0, 50.0)
 
-    assert classification.taxonomy_alignment == 0.0
-    assert classification.sfdr_article == 6
-    assert classification.erc8040_rating == "CCC"
-    assert abs(classification.carbon_intensity - 275.0) < 0.01  # 500 * (1 - 0.45)
+        expected = 500.0 * (1.0 - environmental / 100.0)
+        assert bridge._estimate_carbon_intensity(score) == approx(expected, abs=1e-9)
 
 
-def test_create_setr_message():
-    """Test SETR message XML generation."""
-    bridge = ISO20022Bridge()
+def test_esg_to_iso_matches_component_methods(bridge):
+    """Test the fused conversion agrees with the individual mapping methods."""
+    for environmental in [0.0, 30.0, 59.9, 60.0, 65.5, 79.9, 80.0, 92.0, 100.0]:
+        score = _score(environmental, 70.0, 60.0)
+        classification = bridge.esg_to_iso(score)
+
+        assert classification.taxonomy_alignment == bridge.calculate_taxonomy_alignment(score)
+        assert classification.sfdr_article == bridge.map_sfdr_article(score.rating)
+        assert classification.erc8040_rating == score.rating.value
+        assert classification.carbon_intensity == bridge._estimate_carbon_intensity(score)
 
+
+def test_esg_to_iso_reuses_result_for_equal_scores(bridge):
+    """Test equal scores share one cached classification."""
+    first = bridge.esg_to_iso(ESGScore.create(81.0, 77.0, 73.0))
+    second = bridge.esg_to_iso(ESGScore.create(81.0, 77.0, 73.0))
+
+    assert second is first
+    assert bridge.esg_to_iso(ESGScore.create(81.0, 77.0, 73.5)) is not first
+
+
+def test_esg_to_iso_batch(bridge, batch_backend):
+    """Test batch conversion matches scalar esg_to_iso element-wise."""
+    triples = [
+        (90.0, 85.0, 80.0),
+        (75.0, 70.0, 68.0),
+        (45.0, 50.0, 48.0),
+        (100.0, 100.0, 100.0),
+        (50.0, 50.0, 50.0),
+        (0.0, 50.0, 50.0),
+        (92.0, 88.0, 85.0),
+        (65.0, 60.0, 58.0),
+    ]
+    env, soc, gov = zip(*triples, strict=True)
+
+    tax, sfdr, ratings, carbon = bridge.esg_to_iso_batch(env, soc, gov)
+
+    for i, triple in enumerate(triples):
+        expected = bridge.esg_to_iso(_score(*triple))
+        assert tax[i] == expected.taxonomy_alignment
+        assert sfdr[i] == expected.sfdr_article
+        assert ratings[i] == expected.erc8040_rating
+        assert carbon[i] == approx(expected.carbon_intensity, abs=1e-9)
+
+    with pytest.raises(ValueError):
+        bridge.esg_to_iso_batch([101.0], [50.0], [50.0])
+
+
+def test_esg_to_iso_batch_broadcasts_components(bridge):
+    """Test batch components broadcast together and mismatched shapes raise."""
+    pytest.importorskip("numpy")
+
+    broadcast = bridge.esg_to_iso_batch([90.0, 80.0, 70.0, 60.0], [50.0], 50.0)
+    explicit = bridge.esg_to_iso_batch([90.0, 80.0, 70.0, 60.0], [50.0] * 4, [50.0] * 4)
+    for got, expected in zip(broadcast, explicit, strict=True):
+        assert list(got) == list(expected)
+
+    with pytest.raises(ValueError):
+        bridge.esg_to_iso_batch([90.0, 80.0, 70.0, 60.0], [50.0, 50.0], [50.0, 50.0, 50.0])
+
+
+def test_create_setr_message(bridge):
+    """Test SETR message XML generation."""
     instrument = FinancialInstrument(
         isin="US46434G1031",
         lei="549300PZDW6EBUUJ8G35",
@@ -139,26 +237,24 @@ def test_create_setr_message():
     xml = bridge.create_setr_message(instrument, classification)
 
     # Verify XML structure and content
-    assert '<?xml version="1.0" encoding="UTF-8"?>' in xml
-    assert 'urn:iso:std:iso:20022:tech:xsd:setr.010.001.04' in xml
-    assert '<ISIN>US46434G1031</ISIN>' in xml
-    assert '<LEI>549300PZDW6EBUUJ8G35</LEI>' in xml
-    assert '<Nm>ERC8040 Green Bond</Nm>' in xml
-    assert '<TaxnmyAlgnmt>92.0</TaxnmyAlgnmt>' in xml
-    assert '<SFDRArtcl>9</SFDRArtcl>' in xml
-    assert '<ERC8040Rtg>AA</ERC8040Rtg>' in xml
+    assert xml.startswith('<?xml version="1.0" encoding="UTF-8"?>')
 
+    root, fields = parse_setr(xml)
+    assert root.tag == "{urn:iso:std:iso:20022:tech:xsd:setr.010.001.04}Document"
+    assert fields == {
+        "isin": "US46434G1031",
+        "lei": "549300PZDW6EBUUJ8G35",
+        "nm": "ERC8040 Green Bond",
+        "tax": "92.0",
+        "sfdr": "9",
+        "rtg": "AA",
+    }
 
-def test_create_setr_message_integration():
-    """Test complete integration from ESG score to SETR message."""
-    bridge = ISO20022Bridge()
 
+def test_create_setr_message_integration(bridge):
+    """Test complete integration from ESG score to SETR message."""
     # Create ESG score
-    score = ESGScore.create(
-        environmental=92.0,
-        social=88.0,
-        governance=85.0
-    )
+    score = _score(92.0, 88.0, 85.0)
 
     # Convert to ISO classification
     classification = bridge.esg_to_iso(score)
@@ -174,10 +270,53 @@ def test_create_setr_message_integration():
     xml = bridge.create_setr_message(instrument, classification)
 
     # Verify complete workflow
-    assert '<ISIN>US1234567890</ISIN>' in xml
-    assert '<TaxnmyAlgnmt>92.0</TaxnmyAlgnmt>' in xml
-    assert '<SFDRArtcl>9</SFDRArtcl>' in xml
-    assert '<ERC8040Rtg>AA</ERC8040Rtg>' in xml
+    assert xml.startswith('<?xml version="1.0" encoding="UTF-8"?>')
+    assert xml.endswith("</Document>")
+    _, fields = parse_setr(xml)
+    assert fields["isin"] == "US1234567890"
+    assert fields["tax"] == "92.0"
+    assert fields["sfdr"] == "9"
+    assert fields["rtg"] == "AA"
+
+
+def test_create_setr_message_escapes_text(bridge):
+    """Test SETR message escapes XML special characters."""
+    instrument = FinancialInstrument(
+        isin="US46434G1031",
+        lei="549300PZDW6EBUUJ8G35",
+        name="Green & Blue <Bond>"
+    )
+
+    classification = ESGClassification(
+        taxonomy_alignment=92.0,
+        sfdr_article=9,
+        erc8040_rating="AA",
+    )
+
+    xml = bridge.create_setr_message(instrument, classification)
+
+    assert '<Nm>Green &amp; Blue &lt;Bond&gt;</Nm>' in xml
+    _, fields = parse_setr(xml)
+    assert fields["nm"] == "Green & Blue <Bond>"
+
+
+def test_write_setr_message(bridge):
+    """Test writing a SETR message matches the string form, UTF-8 encoded."""
+    from io import BytesIO
+
+    instrument = FinancialInstrument(
+        isin="US46434G1031",
+        lei="549300PZDW6EBUUJ8G35",
+        name="Société Générale & Co"
+    )
+    classification = bridge.esg_to_iso(_score(92.0, 88.0, 85.0))
+
+    buffer = BytesIO()
+    bridge.write_setr_message(instrument, classification, buffer)
+
+    written = buffer.getvalue()
+    assert written.startswith(b'<?xml version="1.0" encoding="UTF-8"?>')
+    assert written == bridge.create_setr_message(instrument, classification).encode("utf-8")
 
 
 def test_financial_instrument_creation():
@@ -208,6 +347,24 @@ def test_esg_classification_creation():
     assert classification.carbon_intensity == 75.0
 
 
+def test_esg_classification_is_immutable():
+    """Test ESG classifications cannot be modified and are hashable."""
+    from dataclasses import FrozenInstanceError
+
+    classification = ESGClassification(
+        taxonomy_alignment=85.0,
+        sfdr_article=9,
+        erc8040_rating="AA",
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        classification.sfdr_article = 6
+
+    assert hash(classification) == hash(
+        ESGClassification(taxonomy_alignment=85.0, sfdr_article=9, erc8040_rating="AA")
+    )
+
+
 def test_esg_classification_without_carbon_intensity():
     """Test ESG classification with optional carbon intensity."""
     classification = ESGClassification(
@@ -218,23 +375,3 @@ def test_esg_classification_without_carbon_intensity():
 
     assert classification.taxonomy_alignment == 85.0
     assert classification.carbon_intensity is None
-
-
-def test_carbon_intensity_estimation():
-    """Test carbon intensity estimation across score range."""
-    bridge = ISO20022Bridge()
-
-    # High environmental score = low carbon intensity
-    score_100 = ESGScore.create(100.0, 100.0, 100.0)
-    classification = bridge.esg_to_iso(score_100)
-    assert abs(classification.carbon_intensity - 0.0) < 0.01
-
-    # Medium environmental score = medium carbon intensity
-    score_50 = ESGScore.create(50.0, 50.0, 50.0)
-    classification = bridge.esg_to_iso(score_50)
-    assert abs(classification.carbon_intensity - 250.0) < 0.01
-
-    # Low environmental score = high carbon intensity
-    score_0 = ESGScore.create(0.0, 50.0, 50.0)
-    classification = bridge.esg_to_iso(score_0)
-    assert abs(classification.carbon_intensity - 500.0) < 0.01